@@ -4,20 +4,47 @@ Structured logging configuration for the Ambient Music backend.
 Provides JSON-formatted logging with configurable log levels via LOG_LEVEL env var.
 """
 
+import functools
 import json
 import logging
 import os
 import sys
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Optional
+
+# orjson is a C-level serializer (~2x faster on structured log records);
+# fall back to stdlib json when it isn't installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Log level names to stdlib levels, resolved once at import
+_LEVEL_MAP: dict[str, int] = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "WARN": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
 
 
 class JsonFormatter(logging.Formatter):
     """Custom formatter that outputs JSON-formatted log records."""
 
-    def format(self, record: logging.LogRecord) -> str:
+    def __init__(self) -> None:
+        super().__init__()
+        # Bind locals once so format() skips two global lookups per record
+        self._utc = timezone.utc
+        self._fromts = datetime.fromtimestamp
+
+    def format(self, record: logging.LogRecord) -> bytes | str:
         log_data = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            # Reuse the timestamp logging already captured at record creation
+            # (avoids a second clock syscall); orjson serializes it natively
+            "timestamp": self._fromts(record.created, self._utc),
             "level": record.levelname,
             "event": record.getMessage(),
         }
@@ -30,21 +57,50 @@ class JsonFormatter(logging.Formatter):
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
 
-        return json.dumps(log_data)
+        # default=repr keeps the hot path branch-free: non-serializable
+        # extra_data (e.g. bytes previews) degrades to its repr instead of
+        # raising TypeError and killing the calling loop
+        if orjson is not None:
+            # Return UTF-8 bytes directly; the handler writes them as-is
+            return orjson.dumps(log_data, option=orjson.OPT_UTC_Z, default=repr)
+        log_data["timestamp"] = log_data["timestamp"].isoformat()
+        return json.dumps(log_data, default=repr)
 
 
+class BytesStreamHandler(logging.Handler):
+    """
+    Handler that writes formatted records straight to the stdout byte buffer.
+
+    When the formatter already produces UTF-8 bytes (orjson), this skips the
+    str->bytes encode round trip a text-mode StreamHandler would perform.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            line = self.format(record)
+            if isinstance(line, str):
+                line = line.encode("utf-8")
+            # Some harnesses swap sys.stdout for a text-only object
+            buffer = getattr(sys.stdout, "buffer", None)
+            if buffer is not None:
+                buffer.write(line + b"\n")
+                buffer.flush()
+            else:
+                sys.stdout.write(line.decode("utf-8") + "\n")
+                sys.stdout.flush()
+        except Exception:
+            self.handleError(record)
+
+
+@functools.lru_cache(maxsize=1)
 def get_log_level() -> int:
-    """Get log level from environment variable."""
+    """Get log level from environment variable (read once and cached)."""
     level_name = os.getenv("LOG_LEVEL", "INFO").upper()
-    level_map = {
-        "DEBUG": logging.DEBUG,
-        "INFO": logging.INFO,
-        "WARNING": logging.WARNING,
-        "WARN": logging.WARNING,
-        "ERROR": logging.ERROR,
-        "CRITICAL": logging.CRITICAL,
-    }
-    return level_map.get(level_name, logging.INFO)
+    return _LEVEL_MAP.get(level_name, logging.INFO)
+
+
+# Cached logger so repeated imports/reloads skip handler setup entirely
+_LOGGER: Optional[logging.Logger] = None
 
 
 def setup_logger(name: str = "ambient_music") -> logging.Logger:
@@ -57,28 +113,50 @@ def setup_logger(name: str = "ambient_music") -> logging.Logger:
     Returns:
         Configured logger instance
     """
+    global _LOGGER
+    if _LOGGER is not None:
+        return _LOGGER
+
     logger = logging.getLogger(name)
 
     # Avoid adding handlers multiple times
     if logger.handlers:
+        _LOGGER = logger
         return logger
 
     logger.setLevel(get_log_level())
 
-    # Console handler with JSON formatting
-    handler = logging.StreamHandler(sys.stdout)
+    # Console handler with JSON formatting, writing bytes to avoid a
+    # per-record encode round trip
+    handler = BytesStreamHandler()
     handler.setFormatter(JsonFormatter())
     logger.addHandler(handler)
 
     # Prevent propagation to root logger
     logger.propagate = False
 
+    _LOGGER = logger
     return logger
 
 
 # Create a default logger instance
 logger = setup_logger()
 
+# Computed once at setup so hot paths can skip log calls (and their kwargs
+# dict construction) entirely when debug logging is off.
+DEBUG_ENABLED = logger.isEnabledFor(logging.DEBUG)
+
+# Level name -> (stdlib level, bound logger method), resolved once at import
+# so log_event skips str.lower() and the getattr probe per call
+_DISPATCH: dict[str, tuple[int, Any]] = {
+    "debug": (logging.DEBUG, logger.debug),
+    "info": (logging.INFO, logger.info),
+    "warn": (logging.WARNING, logger.warning),
+    "warning": (logging.WARNING, logger.warning),
+    "error": (logging.ERROR, logger.error),
+    "critical": (logging.CRITICAL, logger.critical),
+}
+
 
 def log_event(event: str, level: str = "info", **kwargs: Any) -> None:
     """
@@ -89,28 +167,39 @@ def log_event(event: str, level: str = "info", **kwargs: Any) -> None:
         level: Log level (debug, info, warning, error)
         **kwargs: Additional key-value pairs to include in the log
     """
-    log_func = getattr(logger, level.lower(), logger.info)
+    level_int, log_func = _DISPATCH.get(level.lower(), _DISPATCH["info"])
+
+    # Fast path: skip the extra-dict build when the level is disabled
+    if not logger.isEnabledFor(level_int):
+        return
+
+    log_func(event, extra={"extra_data": kwargs} if kwargs else None)
+
 
-    # Create a LogRecord with extra data
-    extra = {"extra_data": kwargs} if kwargs else {}
-    log_func(event, extra=extra)
+# Bound logger methods: the fixed-level helpers below call these directly,
+# skipping log_event's getattr/lowercase dispatch on hot paths.
+_LOGGER_DEBUG = logger.debug
+_LOGGER_INFO = logger.info
+_LOGGER_WARNING = logger.warning
+_LOGGER_ERROR = logger.error
 
 
 def log_debug(event: str, **kwargs: Any) -> None:
     """Log a debug-level event."""
-    log_event(event, level="debug", **kwargs)
+    if DEBUG_ENABLED:
+        _LOGGER_DEBUG(event, extra={"extra_data": kwargs} if kwargs else None)
 
 
 def log_info(event: str, **kwargs: Any) -> None:
     """Log an info-level event."""
-    log_event(event, level="info", **kwargs)
+    _LOGGER_INFO(event, extra={"extra_data": kwargs} if kwargs else None)
 
 
 def log_warning(event: str, **kwargs: Any) -> None:
     """Log a warning-level event."""
-    log_event(event, level="warning", **kwargs)
+    _LOGGER_WARNING(event, extra={"extra_data": kwargs} if kwargs else None)
 
 
 def log_error(event: str, **kwargs: Any) -> None:
     """Log an error-level event."""
-    log_event(event, level="error", **kwargs)
+    _LOGGER_ERROR(event, extra={"extra_data": kwargs} if kwargs else None)
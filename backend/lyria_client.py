@@ -3,16 +3,25 @@ Lyria RealTime client wrapper for managing music generation sessions.
 """
 
 import asyncio
+import functools
+import inspect
+import logging
 from dataclasses import dataclass
-from typing import Callable, Optional
+from typing import Awaitable, Callable, Optional, Union
 from google import genai
 from google.genai import types
 
-from logging_config import log_info, log_warning, log_error, log_debug
+from logging_config import DEBUG_ENABLED, logger, log_info, log_warning, log_error, log_debug
 from prompt_generator import WeightedPrompt
 
 
-@dataclass
+@functools.lru_cache(maxsize=256)
+def _wp(text: str, weight: float) -> types.WeightedPrompt:
+    """Build (and cache) a Lyria WeightedPrompt; prompts repeat across updates."""
+    return types.WeightedPrompt(text=text, weight=weight)
+
+
+@dataclass(slots=True)
 class LyriaConfig:
     """Configuration for Lyria music generation."""
     bpm: int = 80
@@ -31,7 +40,21 @@ class LyriaSession:
     Handles connection to the Lyria API, prompt management,
     and audio chunk streaming.
     """
-    
+
+    __slots__ = (
+        "_api_key",
+        "_client",
+        "_session",
+        "_context_manager",
+        "_is_playing",
+        "_audio_task",
+        "_consume_task",
+        "_audio_q",
+        "_on_audio_chunk",
+        "_prompts",
+        "_config",
+    )
+
     def __init__(self, api_key: str):
         self._api_key = api_key
         self._client = genai.Client(
@@ -42,7 +65,11 @@ class LyriaSession:
         self._context_manager = None
         self._is_playing = False
         self._audio_task: Optional[asyncio.Task] = None
-        self._on_audio_chunk: Optional[Callable[[bytes], None]] = None
+        self._consume_task: Optional[asyncio.Task] = None
+        # Bounded hand-off between receive and callback: a slow consumer
+        # backpressures here instead of stalling the websocket read
+        self._audio_q: asyncio.Queue[bytes] = asyncio.Queue(maxsize=64)
+        self._on_audio_chunk: Optional[Callable[[bytes], Union[None, Awaitable[None]]]] = None
         self._prompts: list[WeightedPrompt] = []
         self._config: Optional[LyriaConfig] = None
     
@@ -79,11 +106,9 @@ class LyriaSession:
         
         try:
             # Set weighted prompts
-            lyria_prompts = [
-                types.WeightedPrompt(text=p.text, weight=p.weight)
-                for p in prompts
-            ]
-            log_info("lyria_setting_prompts", prompts=[p.text for p in prompts])
+            lyria_prompts = [_wp(p.text, p.weight) for p in prompts]
+            if logger.isEnabledFor(logging.INFO):
+                log_info("lyria_setting_prompts", prompts=[p.text for p in prompts])
             await self._session.set_weighted_prompts(prompts=lyria_prompts)
             
             # Set generation config (audio_format and sample_rate_hz are fixed by the API)
@@ -104,13 +129,17 @@ class LyriaSession:
     
     async def start_streaming(
         self,
-        on_audio_chunk: Callable[[bytes], None],
+        on_audio_chunk: Callable[[bytes], Union[None, Awaitable[None]]],
     ) -> None:
         """
         Start streaming music and call the callback for each audio chunk.
-        
+
         Args:
-            on_audio_chunk: Callback function that receives raw PCM audio bytes
+            on_audio_chunk: Callback that receives raw PCM audio bytes.
+                Chunks arriving in the same server message are concatenated,
+                so each call may carry several frames (still pcm16 @ 48 kHz).
+                May be async; an async callback that blocks (e.g. on a full
+                downstream buffer) backpressures the consume loop.
         """
         if not self._session:
             raise RuntimeError("Session not connected. Call connect() first.")
@@ -124,8 +153,10 @@ class LyriaSession:
             await self._session.play()
             log_info("lyria_playback_started")
             
-            # Start receiving audio in background
+            # Receive and consume in separate tasks so network reads overlap
+            # with downstream delivery
             self._audio_task = asyncio.create_task(self._receive_audio_loop())
+            self._consume_task = asyncio.create_task(self._consume_audio_loop())
         except Exception as e:
             log_error("lyria_start_streaming_failed", error=str(e))
             raise
@@ -138,91 +169,91 @@ class LyriaSession:
         log_info("lyria_receive_loop_started")
         chunk_count = 0
         total_bytes = 0
+        # Bind loop invariants to locals; attribute access is ~3x slower and
+        # this loop runs at audio-chunk cadence. _is_playing can toggle, so it
+        # is still read through self each iteration.
+        audio_q_put = self._audio_q.put
         try:
             async for message in self._session.receive():
                 if not self._is_playing:
-                    # #region agent log
-                    import json; open('/Users/calebgibson/Code/ambient-music/.cursor/debug.log','a').write(json.dumps({"location":"lyria_client.py:receive-loop-exit","message":"exiting loop - is_playing false","data":{"chunks_so_far":chunk_count},"timestamp":__import__('time').time()*1000,"sessionId":"debug-session","hypothesisId":"H3-H5"})+'\n')
-                    # #endregion
+                    log_debug("lyria_receive_loop_exiting", chunks_so_far=chunk_count)
                     break
-                
-                if message.server_content and message.server_content.audio_chunks:
-                    for chunk in message.server_content.audio_chunks:
-                        if self._on_audio_chunk and chunk.data:
-                            chunk_count += 1
-                            total_bytes += len(chunk.data)
-                            if chunk_count % 50 == 1:
-                                log_debug("lyria_chunk_received", chunk_number=chunk_count, chunk_size=len(chunk.data))
-                            self._on_audio_chunk(chunk.data)
-                
-                # Small yield to prevent blocking
-                await asyncio.sleep(0)
+
+                server_content = message.server_content
+                if server_content and server_content.audio_chunks:
+                    # Coalesce all chunks from this message into one queue
+                    # put to amortize downstream send overhead
+                    datas = [c.data for c in server_content.audio_chunks if c.data]
+                    if datas:
+                        data = b"".join(datas) if len(datas) > 1 else datas[0]
+                        chunk_count += 1
+                        total_bytes += len(data)
+                        if DEBUG_ENABLED and chunk_count % 50 == 1:
+                            log_debug("lyria_chunk_received", chunk_number=chunk_count, chunk_size=len(data))
+                        await audio_q_put(data)
+
+                    # The async for already suspends on each websocket read;
+                    # yield explicitly only every 64 chunks for fairness
+                    if chunk_count & 0x3F == 0:
+                        await asyncio.sleep(0)
         except asyncio.CancelledError:
             log_info("lyria_receive_loop_cancelled", chunks_received=chunk_count, total_bytes=total_bytes)
-            # #region agent log
-            import json; open('/Users/calebgibson/Code/ambient-music/.cursor/debug.log','a').write(json.dumps({"location":"lyria_client.py:receive-loop-cancelled","message":"loop cancelled","data":{"chunks":chunk_count,"bytes":total_bytes},"timestamp":__import__('time').time()*1000,"sessionId":"debug-session","hypothesisId":"H3-H5"})+'\n')
-            # #endregion
         except Exception as e:
             log_error("lyria_receive_error", error=str(e), chunks_received=chunk_count)
-            # #region agent log
-            import json; open('/Users/calebgibson/Code/ambient-music/.cursor/debug.log','a').write(json.dumps({"location":"lyria_client.py:receive-loop-error","message":"loop error","data":{"error":str(e),"error_type":type(e).__name__,"chunks":chunk_count},"timestamp":__import__('time').time()*1000,"sessionId":"debug-session","hypothesisId":"H3-H4"})+'\n')
-            # #endregion
     
+    async def _consume_audio_loop(self) -> None:
+        """Background task that drains the audio queue into the callback."""
+        try:
+            while True:
+                data = await self._audio_q.get()
+                callback = self._on_audio_chunk
+                if callback:
+                    result = callback(data)
+                    if inspect.isawaitable(result):
+                        await result
+                self._audio_q.task_done()
+        except asyncio.CancelledError:
+            pass
+
     async def update_prompts(self, prompts: list[WeightedPrompt]) -> None:
         """Update the music prompts while streaming."""
         if not self._session:
             raise RuntimeError("Session not connected.")
         
-        lyria_prompts = [
-            types.WeightedPrompt(text=p.text, weight=p.weight)
-            for p in prompts
-        ]
+        lyria_prompts = [_wp(p.text, p.weight) for p in prompts]
         await self._session.set_weighted_prompts(prompts=lyria_prompts)
     
     async def pause(self) -> None:
         """Pause music playback."""
-        # #region agent log
-        import json; open('/Users/calebgibson/Code/ambient-music/.cursor/debug.log','a').write(json.dumps({"location":"lyria_client.py:pause","message":"pause called","data":{"has_session":self._session is not None,"is_playing":self._is_playing},"timestamp":__import__('time').time()*1000,"sessionId":"debug-session","hypothesisId":"H1-H2"})+'\n')
-        # #endregion
+        log_debug("lyria_pause_requested", has_session=self._session is not None, is_playing=self._is_playing)
         if self._session and self._is_playing:
             await self._session.pause()
             self._is_playing = False
-            # #region agent log
-            import json; open('/Users/calebgibson/Code/ambient-music/.cursor/debug.log','a').write(json.dumps({"location":"lyria_client.py:pause-done","message":"pause completed","data":{"is_playing":self._is_playing},"timestamp":__import__('time').time()*1000,"sessionId":"debug-session","hypothesisId":"H1"})+'\n')
-            # #endregion
-    
+
     async def resume(self) -> None:
         """Resume music playback."""
-        # #region agent log
-        import json; open('/Users/calebgibson/Code/ambient-music/.cursor/debug.log','a').write(json.dumps({"location":"lyria_client.py:resume","message":"resume called","data":{"has_session":self._session is not None,"is_playing":self._is_playing,"session_type":str(type(self._session))},"timestamp":__import__('time').time()*1000,"sessionId":"debug-session","hypothesisId":"H1-H2"})+'\n')
-        # #endregion
+        log_debug("lyria_resume_requested", has_session=self._session is not None, is_playing=self._is_playing)
         if self._session and not self._is_playing:
             try:
-                # #region agent log
-                import json; open('/Users/calebgibson/Code/ambient-music/.cursor/debug.log','a').write(json.dumps({"location":"lyria_client.py:resume-pre-play","message":"about to call session.play()","data":{"session_attrs":dir(self._session)[:10]},"timestamp":__import__('time').time()*1000,"sessionId":"debug-session","hypothesisId":"H2-H4"})+'\n')
-                # #endregion
                 await self._session.play()
                 self._is_playing = True
-                # #region agent log
-                import json; open('/Users/calebgibson/Code/ambient-music/.cursor/debug.log','a').write(json.dumps({"location":"lyria_client.py:resume-success","message":"resume play() succeeded","data":{"is_playing":self._is_playing},"timestamp":__import__('time').time()*1000,"sessionId":"debug-session","hypothesisId":"H1"})+'\n')
-                # #endregion
             except Exception as e:
-                # #region agent log
-                import json; open('/Users/calebgibson/Code/ambient-music/.cursor/debug.log','a').write(json.dumps({"location":"lyria_client.py:resume-error","message":"resume play() failed","data":{"error":str(e),"error_type":type(e).__name__},"timestamp":__import__('time').time()*1000,"sessionId":"debug-session","hypothesisId":"H1-H4"})+'\n')
-                # #endregion
+                log_error("lyria_resume_failed", error=str(e))
                 raise
     
     async def stop(self) -> None:
         """Stop music playback and clean up."""
         self._is_playing = False
         
-        if self._audio_task:
-            self._audio_task.cancel()
-            try:
-                await self._audio_task
-            except asyncio.CancelledError:
-                pass
-            self._audio_task = None
+        for task_attr in ("_audio_task", "_consume_task"):
+            task = getattr(self, task_attr)
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+                setattr(self, task_attr, None)
         
         if self._session:
             try:
@@ -251,7 +282,9 @@ class LyriaSessionManager:
     """
     Manages multiple Lyria sessions for different clients.
     """
-    
+
+    __slots__ = ("_api_key", "_sessions")
+
     def __init__(self, api_key: str):
         self._api_key = api_key
         self._sessions: dict[str, LyriaSession] = {}
@@ -277,6 +310,8 @@ class LyriaSessionManager:
             await session.close()
     
     async def close_all(self) -> None:
-        """Close all active sessions."""
-        for session_id in list(self._sessions.keys()):
-            await self.close_session(session_id)
+        """Close all active sessions concurrently."""
+        await asyncio.gather(
+            *(self.close_session(session_id) for session_id in list(self._sessions)),
+            return_exceptions=True,
+        )
@@ -6,9 +6,11 @@ Socket.IO for streaming audio to clients.
 """
 
 import asyncio
-import base64
+import functools
 import os
+import time
 import uuid
+from collections import deque
 from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
@@ -16,11 +18,26 @@ from typing import Optional
 
 import socketio
 from dotenv import load_dotenv
+
+# orjson speeds up Socket.IO control-message encoding; optional like in
+# logging_config
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# opuslib (libopus bindings) enables the optional compressed audio path;
+# clients opt in via {"codec": "opus"} on join_session
+try:
+    import opuslib
+except ImportError:
+    opuslib = None
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response
 from pydantic import BaseModel
 
-from logging_config import log_info, log_warning, log_error, log_debug
+from logging_config import DEBUG_ENABLED, log_info, log_warning, log_error, log_debug
 from lyria_client import LyriaConfig, LyriaSession, LyriaSessionManager
 from prompt_generator import generate_music_prompts, get_recommended_bpm
 
@@ -48,17 +65,182 @@ class SessionMetrics:
     connected_clients: int = 0
 
 
+class AudioRing:
+    """
+    Bounded audio buffer: a deque guarded by a single asyncio.Event.
+
+    Cheaper than asyncio.Queue at audio-chunk rates — get/put on the Queue
+    allocate a Future and walk waiter lists per chunk, while this is a plain
+    append/popleft plus one Event signal.
+    """
+
+    __slots__ = ("dq", "evt", "space", "maxlen")
+
+    def __init__(self, maxlen: int = 100, evt: Optional[asyncio.Event] = None):
+        self.dq: deque[bytes] = deque()
+        # Rings can share one Event so a single consumer can wait on all of
+        # them (the global broadcast scheduler does this)
+        self.evt = evt if evt is not None else asyncio.Event()
+        # Set by the consumer whenever it frees a slot
+        self.space = asyncio.Event()
+        self.maxlen = maxlen
+
+    async def put(self, data: bytes) -> None:
+        """
+        Append a chunk, waiting for room when the ring is full.
+
+        This is the backpressure path: a slow consumer stalls the producer
+        here instead of forcing silent chunk drops.
+        """
+        while len(self.dq) >= self.maxlen:
+            self.space.clear()
+            await self.space.wait()
+        self.dq.append(data)
+        self.evt.set()
+
+    def __len__(self) -> int:
+        return len(self.dq)
+
+
+@dataclass
+class SessionState:
+    """
+    All server-side state for one music session.
+
+    Consolidated so hot paths (audio callback, broadcast loop, socket
+    handlers) pay a single dict lookup instead of one per fragment, and so
+    session setup/teardown can't leave the fragments half-populated.
+    """
+    metrics: SessionMetrics
+    ring: AudioRing
+    prompts: list[dict]
+    room: str
+    # Prompt list serialized once at session start; None when orjson is absent
+    prompts_json: Optional[bytes] = None
+    # Optional Opus side-channel (created lazily on the first opus join)
+    opus_room: str = ""
+    opus_clients: int = 0
+    opus_encoder: Optional[object] = None
+    opus_buf: bytearray = field(default_factory=bytearray)
+
+
 # Application start time for uptime tracking
 app_start_time: Optional[datetime] = None
 
 # Global session manager
 session_manager: Optional[LyriaSessionManager] = None
 
-# Audio queues for each session (to buffer chunks for Socket.IO clients)
-audio_queues: dict[str, asyncio.Queue] = {}
+# Per-session state (audio buffer, metrics, prompts)
+sessions: dict[str, SessionState] = {}
+
+# Wakeup signal shared by all session rings, waited on by the scheduler
+broadcast_wakeup: asyncio.Event = asyncio.Event()
 
-# Session metrics for observability
-session_metrics: dict[str, SessionMetrics] = {}
+# Coalescing byte budget per emit: ~80ms of 48kHz stereo pcm16
+COALESCE_TARGET_BYTES = int(48000 * 2 * 2 * 0.08)
+
+# One 20ms Opus frame: 960 samples/channel @ 48kHz stereo pcm16
+OPUS_FRAME_SAMPLES = 960
+OPUS_FRAME_BYTES = OPUS_FRAME_SAMPLES * 2 * 2
+
+# The single broadcast scheduler task (started in lifespan)
+broadcast_task: Optional[asyncio.Task] = None
+
+# (time bucket, payload) memo for /metrics, refreshed at most once a second
+_metrics_cache: tuple[int, dict] = (-1, {})
+
+# Running totals maintained on the producer path so /metrics reads them in
+# O(1) instead of walking every session per scrape. Unlike per-session
+# metrics these survive session teardown.
+global_metrics = {
+    "total_bytes_sent": 0,
+    "total_chunks_sent": 0,
+    "total_chunks_dropped": 0,
+}
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_prompts(
+    title: str,
+    subjects: Optional[tuple[str, ...]],
+    description: Optional[str],
+    authors: Optional[tuple[str, ...]],
+):
+    """
+    Memoized prompt/BPM pipeline keyed by the book's hashable fields.
+
+    The underlying generators are pure, so popular books skip the keyword
+    scanning entirely on repeat /music/start requests.
+    """
+    subject_list = list(subjects) if subjects else None
+    prompts, mood_config = generate_music_prompts(
+        title=title,
+        subjects=subject_list,
+        description=description,
+        authors=list(authors) if authors else None,
+    )
+    bpm = get_recommended_bpm(subject_list)
+    return prompts, mood_config, bpm
+
+
+# Keys known to be in _cached_prompts; lets the async wrapper skip the
+# executor hop on repeat books
+_seen_prompt_keys: set[tuple] = set()
+
+
+async def _prompts_for_book(book: "BookMetadata"):
+    """
+    Async wrapper around _cached_prompts.
+
+    Cache hits resolve inline; misses run the keyword scanning in a worker
+    thread so session creation doesn't block the event loop (and the audio
+    broadcaster) for other sessions.
+    """
+    key = (
+        book.title,
+        tuple(book.subjects) if book.subjects else None,
+        book.description,
+        tuple(book.authors) if book.authors else None,
+    )
+    if key in _seen_prompt_keys:
+        return _cached_prompts(*key)
+
+    loop = asyncio.get_running_loop()
+    result = await loop.run_in_executor(None, _cached_prompts, *key)
+    if len(_seen_prompt_keys) >= 2048:
+        _seen_prompt_keys.clear()
+    _seen_prompt_keys.add(key)
+    return result
+
+class _OrjsonSerializer:
+    """
+    json-module shim for python-socketio backed by orjson.
+
+    Packet.encode passes separators=; orjson's C encoder already emits
+    compact output, so the kwargs are accepted and ignored.
+    """
+
+    @staticmethod
+    def dumps(obj, *args, **kwargs) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+    @staticmethod
+    def loads(s, *args, **kwargs):
+        return orjson.loads(s)
+
+
+# Optional msgpack packet framing: ~2x faster encode and smaller
+# control-plane payloads, but clients must connect with the matching
+# msgpack parser, so it is opt-in (requires the msgpack package)
+SOCKETIO_SERIALIZER = os.getenv("SOCKETIO_SERIALIZER", "default")
+
+# Optional Redis-backed client manager. This does NOT remove the
+# sticky-routing requirement (see backend/README.md): join_session validates
+# against the owner worker's local session state and audio emission is gated
+# on its local client counter, so clients must still connect to the worker
+# that owns their session. Redis only lets room emits reach sockets hosted
+# by other workers once cross-worker session state exists.
+REDIS_URL = os.getenv("REDIS_URL")
 
 # Create Socket.IO server with ASGI mode
 sio = socketio.AsyncServer(
@@ -66,22 +248,31 @@ sio = socketio.AsyncServer(
     cors_allowed_origins="*",
     logger=False,
     engineio_logger=False,
+    serializer=SOCKETIO_SERIALIZER,
+    json=_OrjsonSerializer if orjson is not None else None,
+    client_manager=socketio.AsyncRedisManager(REDIS_URL) if REDIS_URL else None,
 )
 
 # Mapping of socket ID to session ID for cleanup
-socket_sessions: dict[str, str] = {}
+socket_sessions: dict[str, tuple[str, str]] = {}  # sid -> (session_id, room)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler."""
-    global session_manager, app_start_time
+    global session_manager, app_start_time, broadcast_task
     app_start_time = datetime.now(timezone.utc)
     session_manager = LyriaSessionManager(GEMINI_API_KEY)
+    broadcast_task = asyncio.create_task(broadcast_scheduler())
     log_info("server_started", api_key_configured=True)
     yield
     # Cleanup on shutdown
-    log_info("server_stopping", active_sessions=len(session_metrics))
+    log_info("server_stopping", active_sessions=len(sessions))
+    broadcast_task.cancel()
+    try:
+        await broadcast_task
+    except asyncio.CancelledError:
+        pass
     await session_manager.close_all()
 
 
@@ -90,6 +281,9 @@ fastapi_app = FastAPI(
     description="Stream AI-generated ambient music based on book themes",
     version="1.0.0",
     lifespan=lifespan,
+    # orjson serializes responses 3-5x faster than stdlib json; /metrics
+    # with many sessions benefits the most
+    default_response_class=ORJSONResponse,
 )
 
 # CORS configuration for React Native
@@ -132,82 +326,140 @@ class SessionStatusResponse(BaseModel):
     prompts: list[dict[str, float | str]]
 
 
-# Helper to broadcast audio to Socket.IO room
-async def broadcast_audio_to_room(session_id: str) -> None:
+async def _emit_control(event: str, payload: dict, room_name: str) -> None:
     """
-    Background task that reads from the audio queue and 
-    broadcasts to all clients in the Socket.IO room.
+    Emit a small control message to each room participant in parallel.
+
+    Rooms here typically hold 1-3 clients; concurrent per-sid sends give
+    lower tail latency than the serial room walk for these tiny payloads,
+    and an empty room skips serialization entirely. Audio stays on the
+    room-based path to keep its single-encode savings.
     """
-    log_info("broadcast_task_started", session_id=session_id)
-    queue = audio_queues.get(session_id)
-    metrics = session_metrics.get(session_id)
-    if not queue:
-        log_warning("broadcast_no_queue", session_id=session_id)
+    participants = [sid for sid, _ in sio.manager.get_participants("/", room_name)]
+    if not participants:
         return
-    
-    room_name = f"session_{session_id}"
-    
-    while True:
-        try:
-            queue_size = queue.qsize()
-            log_debug("broadcast_waiting", session_id=session_id, queue_size=queue_size)
-            
-            # Track max queue depth
-            if metrics and queue_size > metrics.max_queue_depth:
-                metrics.max_queue_depth = queue_size
-            
-            audio_data = await asyncio.wait_for(queue.get(), timeout=1.0)
-            chunk_size = len(audio_data)
-            log_debug("broadcast_chunk_received", session_id=session_id, chunk_size=chunk_size)
-            
-            # Encode audio as base64 for transmission
-            encoded = base64.b64encode(audio_data).decode('utf-8')
-            
-            # Emit to all clients in the session room
-            await sio.emit("audio_chunk", {"data": encoded}, room=room_name)
-            
-            # Update metrics
-            if metrics:
-                metrics.chunks_sent += 1
-                metrics.bytes_sent += chunk_size
-            
-            # Log every 50 chunks (~1 second of audio at typical chunk rates)
-            if metrics and metrics.chunks_sent % 50 == 0:
-                log_info(
-                    "audio_streaming_progress",
-                    session_id=session_id,
-                    chunks_sent=metrics.chunks_sent,
-                    bytes_sent=metrics.bytes_sent,
-                    kb_sent=round(metrics.bytes_sent / 1024, 1),
-                )
-            
-            queue.task_done()
-        except asyncio.TimeoutError:
-            # Check if session still exists
-            if session_id not in audio_queues:
-                break
-        except asyncio.CancelledError:
-            break
-        except Exception as e:
-            log_error("broadcast_error", session_id=session_id, error=str(e))
-            break
-    
-    if metrics:
+    await asyncio.gather(*(sio.emit(event, payload, to=sid) for sid in participants))
+
+
+async def _service_session(session_id: str, state: SessionState) -> bool:
+    """
+    Emit one coalesced audio batch for a session.
+
+    Returns True when a chunk was consumed, so the scheduler knows the round
+    did useful work.
+    """
+    dq = state.ring.dq
+    if not dq:
+        return False
+
+    metrics = state.metrics
+    queue_size = len(dq)
+    if queue_size > metrics.max_queue_depth:
+        metrics.max_queue_depth = queue_size
+
+    audio_data = dq.popleft()
+    state.ring.space.set()
+
+    # No clients in the room yet (pre-join buffering window): drop the
+    # chunk without paying for framing and emit, but keep the drop counters
+    # honest so /metrics reflects the discarded audio
+    if metrics.connected_clients == 0:
+        metrics.chunks_dropped += 1
+        global_metrics["total_chunks_dropped"] += 1
+        return True
+
+    batched = 1
+
+    # Coalesce whatever else is already queued into one binary frame to
+    # amortize Engine.IO framing and per-client send overhead, bounded by a
+    # byte budget (~80ms of audio) so latency stays small; the payload
+    # stays raw PCM. Nothing waits for more data — only already-buffered
+    # chunks are merged.
+    if dq:
+        buf = [audio_data]
+        total = len(audio_data)
+        while dq and total < COALESCE_TARGET_BYTES and len(buf) < 8:
+            nxt = dq.popleft()
+            buf.append(nxt)
+            total += len(nxt)
+        audio_data = b"".join(buf)
+        batched = len(buf)
+        state.ring.space.set()
+
+    chunk_size = len(audio_data)
+
+    # Emit raw PCM bytes as a binary frame to the pcm clients in the session
+    # room; skips base64's 1.33x inflation and two allocations per chunk
+    if metrics.connected_clients > state.opus_clients:
+        await sio.emit("audio_chunk", audio_data, room=state.room)
+
+    # Optional Opus side-channel: ~10x smaller frames for remote clients.
+    # PCM accumulates in opus_buf and is encoded in exact 20ms frames; the
+    # remainder carries over to the next batch.
+    if state.opus_clients and state.opus_encoder is not None:
+        state.opus_buf.extend(audio_data)
+        frames = []
+        while len(state.opus_buf) >= OPUS_FRAME_BYTES:
+            pcm_frame = bytes(state.opus_buf[:OPUS_FRAME_BYTES])
+            del state.opus_buf[:OPUS_FRAME_BYTES]
+            frames.append(state.opus_encoder.encode(pcm_frame, OPUS_FRAME_SAMPLES))
+        if frames:
+            await sio.emit("audio_opus", frames, room=state.opus_room)
+
+    # Update metrics
+    metrics.chunks_sent += batched
+    metrics.bytes_sent += chunk_size
+    global_metrics["total_chunks_sent"] += batched
+    global_metrics["total_bytes_sent"] += chunk_size
+
+    # Log every ~50 chunks (~1 second of audio at typical chunk rates)
+    if (metrics.chunks_sent // 50) != ((metrics.chunks_sent - batched) // 50):
         log_info(
-            "broadcast_ended",
+            "audio_streaming_progress",
             session_id=session_id,
-            total_chunks=metrics.chunks_sent,
-            total_kb=round(metrics.bytes_sent / 1024, 1),
+            chunks_sent=metrics.chunks_sent,
+            bytes_sent=metrics.bytes_sent,
+            kb_sent=round(metrics.bytes_sent / 1024, 1),
         )
-    else:
-        log_info("broadcast_ended", session_id=session_id)
+    return True
 
 
-# Stored prompts per session for status endpoint
-session_prompts: dict[str, list[dict]] = {}
+async def broadcast_scheduler() -> None:
+    """
+    Single fair broadcaster across all sessions.
+
+    Services at most one batch per session per round, so one session with a
+    slow emit (e.g. a stuck client) cannot monopolize the event loop and
+    starve the other streams.
+    """
+    log_info("broadcast_scheduler_started")
+    while True:
+        try:
+            serviced = False
+            for session_id, state in list(sessions.items()):
+                try:
+                    if await _service_session(session_id, state):
+                        serviced = True
+                except Exception as e:
+                    # Isolate per-session failures so one bad emit doesn't
+                    # skip the rest of the round
+                    log_error("broadcast_error", session_id=session_id, error=str(e))
+
+            if serviced:
+                # Yield between rounds so other tasks get loop time
+                await asyncio.sleep(0)
+            else:
+                # All rings empty: sleep until a producer pushes. No timeout
+                # poll — shutdown arrives as task cancellation, so the wait
+                # allocates no TimerHandle per idle cycle.
+                broadcast_wakeup.clear()
+                await broadcast_wakeup.wait()
+        except asyncio.CancelledError:
+            break
+        except Exception as e:
+            log_error("broadcast_error", error=str(e))
 
-# Broadcast tasks
-broadcast_tasks: dict[str, asyncio.Task] = {}
+    log_info("broadcast_scheduler_stopped")
 
 
 # Socket.IO Event Handlers
@@ -221,14 +473,17 @@ async def connect(sid, environ):
 async def disconnect(sid):
     """Handle client disconnection."""
     # Clean up session mapping
-    session_id = socket_sessions.pop(sid, None)
-    if session_id:
-        room_name = f"session_{session_id}"
+    mapping = socket_sessions.pop(sid, None)
+    if mapping:
+        session_id, room_name = mapping
         await sio.leave_room(sid, room_name)
         # Update metrics
-        metrics = session_metrics.get(session_id)
-        if metrics and metrics.connected_clients > 0:
-            metrics.connected_clients -= 1
+        state = sessions.get(session_id)
+        if state:
+            if state.metrics.connected_clients > 0:
+                state.metrics.connected_clients -= 1
+            if room_name == state.opus_room and state.opus_clients > 0:
+                state.opus_clients -= 1
         log_info("socket_client_disconnected", socket_id=sid, session_id=session_id)
     else:
         log_info("socket_client_disconnected", socket_id=sid)
@@ -238,11 +493,12 @@ async def disconnect(sid):
 async def join_session(sid, data):
     """
     Handle client joining a music session.
-    
-    Expected data: {"session_id": "uuid"}
+
+    Expected data: {"session_id": "uuid", "codec": "pcm16"|"opus" (optional)}
     """
     session_id = data.get("session_id")
-    log_info("socket_join_request", socket_id=sid, session_id=session_id)
+    codec = (data.get("codec") or "pcm16").lower()
+    log_info("socket_join_request", socket_id=sid, session_id=session_id, codec=codec)
     
     if not session_manager:
         log_warning("socket_join_failed", socket_id=sid, reason="service_not_initialized")
@@ -255,25 +511,40 @@ async def join_session(sid, data):
         await sio.emit("error", {"message": "Session not found"}, to=sid)
         return
     
+    state = sessions.get(session_id)
+
+    # Opus clients join a side room fed by the per-session encoder
+    if codec == "opus":
+        if opuslib is None:
+            log_warning("socket_join_failed", socket_id=sid, session_id=session_id, reason="opus_unavailable")
+            await sio.emit("error", {"message": "Opus codec not available on this server"}, to=sid)
+            return
+        if state and state.opus_encoder is None:
+            state.opus_encoder = opuslib.Encoder(48000, 2, opuslib.APPLICATION_AUDIO)
+        room_name = state.opus_room if state else f"session_{session_id}_opus"
+        if state:
+            state.opus_clients += 1
+    else:
+        codec = "pcm16"
+        room_name = state.room if state else f"session_{session_id}"
+
     # Join the session room
-    room_name = f"session_{session_id}"
     await sio.enter_room(sid, room_name)
-    socket_sessions[sid] = session_id
-    
+    socket_sessions[sid] = (session_id, room_name)
+
     # Update metrics
-    metrics = session_metrics.get(session_id)
-    if metrics:
-        metrics.connected_clients += 1
-    
+    if state:
+        state.metrics.connected_clients += 1
+
     log_info("socket_client_joined", socket_id=sid, session_id=session_id, room=room_name)
-    
+
     # Send initial status
     await sio.emit("session_joined", {
         "session_id": session_id,
         "is_playing": session.is_playing,
         "sample_rate": 48000,
         "channels": 2,
-        "format": "pcm16",
+        "format": codec,
     }, to=sid)
 
 
@@ -282,13 +553,16 @@ async def leave_session(sid, data):
     """Handle client leaving a music session."""
     session_id = data.get("session_id")
     if session_id:
-        room_name = f"session_{session_id}"
+        state = sessions.get(session_id)
+        mapping = socket_sessions.pop(sid, None)
+        room_name = mapping[1] if mapping else (state.room if state else f"session_{session_id}")
         await sio.leave_room(sid, room_name)
-        socket_sessions.pop(sid, None)
         # Update metrics
-        metrics = session_metrics.get(session_id)
-        if metrics and metrics.connected_clients > 0:
-            metrics.connected_clients -= 1
+        if state:
+            if state.metrics.connected_clients > 0:
+                state.metrics.connected_clients -= 1
+            if room_name == state.opus_room and state.opus_clients > 0:
+                state.opus_clients -= 1
         log_info("socket_client_left", socket_id=sid, session_id=session_id)
 
 
@@ -310,10 +584,11 @@ async def pause(sid, data):
     
     await session.pause()
     log_info("session_paused", session_id=session_id, socket_id=sid)
-    
+
     # Notify all clients in the room
-    room_name = f"session_{session_id}"
-    await sio.emit("status", {"is_playing": False}, room=room_name)
+    state = sessions.get(session_id)
+    room_name = state.room if state else f"session_{session_id}"
+    await _emit_control("status", {"is_playing": False}, room_name)
 
 
 @sio.event
@@ -334,10 +609,11 @@ async def resume(sid, data):
     
     await session.resume()
     log_info("session_resumed", session_id=session_id, socket_id=sid)
-    
+
     # Notify all clients in the room
-    room_name = f"session_{session_id}"
-    await sio.emit("status", {"is_playing": True}, room=room_name)
+    state = sessions.get(session_id)
+    room_name = state.room if state else f"session_{session_id}"
+    await _emit_control("status", {"is_playing": True}, room_name)
 
 
 # REST Endpoints
@@ -355,16 +631,9 @@ async def start_music(request: StartMusicRequest):
     book = request.book
     log_info("session_start_requested", book_title=book.title)
     
-    # Generate music prompts from book metadata
-    prompts, mood_config = generate_music_prompts(
-        title=book.title,
-        subjects=book.subjects,
-        description=book.description,
-        authors=book.authors,
-    )
-    
-    # Get recommended BPM
-    bpm = get_recommended_bpm(book.subjects)
+    # Generate music prompts from book metadata (memoized for repeat books;
+    # misses run off-loop)
+    prompts, mood_config, bpm = await _prompts_for_book(book)
     
     # Create Lyria config
     config = LyriaConfig(
@@ -384,45 +653,54 @@ async def start_music(request: StartMusicRequest):
         log_error("session_create_failed", session_id=session_id, error=str(e))
         raise HTTPException(status_code=500, detail=f"Failed to create session: {str(e)}")
     
-    # Create audio queue for this session
-    audio_queues[session_id] = asyncio.Queue(maxsize=100)
-    
-    # Initialize session metrics
-    session_metrics[session_id] = SessionMetrics(
-        session_id=session_id,
-        start_time=datetime.now(timezone.utc),
-        book_title=book.title,
-    )
-    
-    # Store prompts for status endpoint
+    # Initialize all per-session state in one place
     prompt_list = [{"text": p.text, "weight": p.weight} for p in prompts]
-    session_prompts[session_id] = prompt_list
-    
-    # Start streaming with callback to queue audio
-    def on_audio_chunk(data: bytes):
-        metrics = session_metrics.get(session_id)
+    state = SessionState(
+        metrics=SessionMetrics(
+            session_id=session_id,
+            start_time=datetime.now(timezone.utc),
+            book_title=book.title,
+        ),
+        ring=AudioRing(maxlen=100, evt=broadcast_wakeup),
+        prompts=prompt_list,
+        room=f"session_{session_id}",
+        opus_room=f"session_{session_id}_opus",
+        prompts_json=orjson.dumps(prompt_list) if orjson is not None else None,
+    )
+    sessions[session_id] = state
+
+    # Start streaming with callback to queue audio; state is captured in the
+    # closure so the hot path does no per-chunk dict lookups
+    metrics = state.metrics
+    ring = state.ring
+    overflow_last = 0.0
+
+    async def on_audio_chunk(data: bytes):
+        nonlocal overflow_last
         try:
             chunk_size = len(data)
-            audio_queues[session_id].put_nowait(data)
+            if len(ring.dq) >= ring.maxlen:
+                # Full ring: the await below backpressures the Lyria
+                # consumer task instead of silently dropping audio. Tell
+                # clients (rate-limited) so they can surface buffering.
+                log_warning("audio_backpressure", session_id=session_id, queue_size=len(ring))
+                now_mono = time.monotonic()
+                if now_mono - overflow_last > 5.0:
+                    overflow_last = now_mono
+                    await _emit_control("stream_health", {"status": "overflow"}, state.room)
+                    await _emit_control("stream_health", {"status": "overflow"}, state.opus_room)
+            await ring.put(data)
             # Track received chunks from Lyria
-            if metrics:
-                metrics.chunks_received += 1
-                metrics.bytes_received += chunk_size
-            log_debug("audio_chunk_queued", session_id=session_id, chunk_size=chunk_size, queue_size=audio_queues[session_id].qsize())
-        except asyncio.QueueFull:
-            if metrics:
-                metrics.chunks_dropped += 1
-            log_warning("audio_chunk_dropped", session_id=session_id, reason="queue_full", chunks_dropped=metrics.chunks_dropped if metrics else 1)
+            metrics.chunks_received += 1
+            metrics.bytes_received += chunk_size
+            if DEBUG_ENABLED:
+                log_debug("audio_chunk_queued", session_id=session_id, chunk_size=chunk_size, queue_size=len(ring))
         except Exception as e:
             log_error("audio_chunk_queue_error", session_id=session_id, error=str(e))
-    
+
+    # The global broadcast scheduler picks the session up on its next round
     await session.start_streaming(on_audio_chunk)
     
-    # Start broadcast task
-    broadcast_tasks[session_id] = asyncio.create_task(
-        broadcast_audio_to_room(session_id)
-    )
-    
     log_info(
         "session_started",
         session_id=session_id,
@@ -431,10 +709,12 @@ async def start_music(request: StartMusicRequest):
         prompts=[p.text for p in prompts],
     )
     
-    return StartMusicResponse(
-        session_id=session_id,
-        prompts=prompt_list,
-    )
+    # Both fields were built server-side this request, so re-validating them
+    # through Pydantic adds no safety; the response_model stays for OpenAPI
+    return ORJSONResponse({
+        "session_id": session_id,
+        "prompts": prompt_list,
+    })
 
 
 @fastapi_app.post("/music/stop/{session_id}")
@@ -448,8 +728,9 @@ async def stop_music(session_id: str):
         raise HTTPException(status_code=404, detail="Session not found")
     
     # Get final metrics before cleanup
-    metrics = session_metrics.get(session_id)
-    if metrics:
+    state = sessions.pop(session_id, None)
+    if state:
+        metrics = state.metrics
         log_info(
             "session_stopping",
             session_id=session_id,
@@ -458,28 +739,21 @@ async def stop_music(session_id: str):
             chunks_dropped=metrics.chunks_dropped,
             duration_seconds=round((datetime.now(timezone.utc) - metrics.start_time).total_seconds(), 1),
         )
-    
-    # Cancel broadcast task
-    task = broadcast_tasks.pop(session_id, None)
-    if task:
-        task.cancel()
-        try:
-            await task
-        except asyncio.CancelledError:
-            pass
-    
-    # Notify clients in the room that session is stopping
-    room_name = f"session_{session_id}"
-    await sio.emit("session_stopped", {"session_id": session_id}, room=room_name)
-    
-    # Close all sockets in the room
-    await sio.close_room(room_name)
-    
-    # Clean up queues, prompts, and metrics
-    audio_queues.pop(session_id, None)
-    session_prompts.pop(session_id, None)
-    session_metrics.pop(session_id, None)
-    
+
+    # The broadcast scheduler drops the session from its rotation now that
+    # it is out of the sessions dict
+
+    # Notify clients and close each room with a single participant walk;
+    # rooms nobody joined are skipped entirely
+    room_names = [state.room, state.opus_room] if state else [f"session_{session_id}"]
+    payload = {"session_id": session_id}
+    for room_name in room_names:
+        participants = [s for s, _ in sio.manager.get_participants("/", room_name)]
+        if not participants:
+            continue
+        await asyncio.gather(*(sio.emit("session_stopped", payload, to=s) for s in participants))
+        await sio.close_room(room_name)
+
     # Close session
     await session_manager.close_session(session_id)
     
@@ -498,18 +772,13 @@ async def pause_music(session_id: str):
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
     
-    # #region agent log
-    import json; open('/Users/calebgibson/Code/ambient-music/.cursor/debug.log','a').write(json.dumps({"location":"main.py:pause_music-pre","message":"about to call session.pause","data":{"session_id":session_id,"session_is_playing":session.is_playing},"timestamp":__import__('time').time()*1000,"sessionId":"debug-session","hypothesisId":"H1-H3"})+'\n')
-    # #endregion
     await session.pause()
-    # #region agent log
-    import json; open('/Users/calebgibson/Code/ambient-music/.cursor/debug.log','a').write(json.dumps({"location":"main.py:pause_music-post","message":"pause completed","data":{"session_id":session_id,"session_is_playing":session.is_playing},"timestamp":__import__('time').time()*1000,"sessionId":"debug-session","hypothesisId":"H1"})+'\n')
-    # #endregion
     log_info("session_paused_rest", session_id=session_id)
-    
+
     # Notify all clients in the room
-    room_name = f"session_{session_id}"
-    await sio.emit("status", {"is_playing": False}, room=room_name)
+    state = sessions.get(session_id)
+    room_name = state.room if state else f"session_{session_id}"
+    await _emit_control("status", {"is_playing": False}, room_name)
     
     return {"status": "paused", "session_id": session_id}
 
@@ -517,9 +786,6 @@ async def pause_music(session_id: str):
 @fastapi_app.post("/music/resume/{session_id}")
 async def resume_music(session_id: str):
     """Resume a paused music session."""
-    # #region agent log
-    import json; open('/Users/calebgibson/Code/ambient-music/.cursor/debug.log','a').write(json.dumps({"location":"main.py:resume_music","message":"resume endpoint called","data":{"session_id":session_id},"timestamp":__import__('time').time()*1000,"sessionId":"debug-session","hypothesisId":"H1"})+'\n')
-    # #endregion
     if not session_manager:
         raise HTTPException(status_code=503, detail="Service not initialized")
     
@@ -527,15 +793,13 @@ async def resume_music(session_id: str):
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
     
-    # #region agent log
-    import json; open('/Users/calebgibson/Code/ambient-music/.cursor/debug.log','a').write(json.dumps({"location":"main.py:resume_music-pre","message":"about to call session.resume","data":{"session_id":session_id,"session_is_playing":session.is_playing},"timestamp":__import__('time').time()*1000,"sessionId":"debug-session","hypothesisId":"H1-H2"})+'\n')
-    # #endregion
     await session.resume()
     log_info("session_resumed_rest", session_id=session_id)
-    
+
     # Notify all clients in the room
-    room_name = f"session_{session_id}"
-    await sio.emit("status", {"is_playing": True}, room=room_name)
+    state = sessions.get(session_id)
+    room_name = state.room if state else f"session_{session_id}"
+    await _emit_control("status", {"is_playing": True}, room_name)
     
     return {"status": "playing", "session_id": session_id}
 
@@ -550,17 +814,34 @@ async def get_session_status(session_id: str):
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
     
-    return SessionStatusResponse(
-        session_id=session_id,
-        is_playing=session.is_playing,
-        prompts=session_prompts.get(session_id, []),
-    )
+    state = sessions.get(session_id)
+    # Returning a Response directly skips Pydantic validation on this hot
+    # polling path; the response_model annotation stays for OpenAPI docs.
+    # The prompt list was serialized once at session start, so the common
+    # case is a bytes concat (session_id is a server-generated UUID).
+    if state is not None and state.prompts_json is not None:
+        body = (
+            b'{"session_id":"' + session_id.encode("utf-8")
+            + b'","is_playing":' + (b"true" if session.is_playing else b"false")
+            + b',"prompts":' + state.prompts_json + b"}"
+        )
+        return Response(content=body, media_type="application/json")
+    return ORJSONResponse({
+        "session_id": session_id,
+        "is_playing": session.is_playing,
+        "prompts": state.prompts if state else [],
+    })
+
+
+# Fully static: startup raises without an API key, so this never changes.
+# Liveness probes hit /health frequently; a constant dict keeps it one emit.
+_HEALTH_RESPONSE = {"status": "healthy", "api_key_configured": True}
 
 
 @fastapi_app.get("/health")
 async def health_check():
     """Health check endpoint."""
-    return {"status": "healthy", "api_key_configured": bool(GEMINI_API_KEY)}
+    return _HEALTH_RESPONSE
 
 
 @fastapi_app.get("/metrics")
@@ -574,21 +855,27 @@ async def get_metrics():
     - Total bytes streamed
     - Per-session: chunks sent/dropped, queue depth, connected clients
     """
+    global _metrics_cache
+
+    # Memoize per one-second bucket: frequent scrapes reuse the same payload
+    bucket = int(time.time())
+    if _metrics_cache[0] == bucket:
+        return _metrics_cache[1]
+
     now = datetime.now(timezone.utc)
     uptime_seconds = (now - app_start_time).total_seconds() if app_start_time else 0
-    
-    # Calculate totals across all sessions
-    total_bytes_sent = sum(m.bytes_sent for m in session_metrics.values())
-    total_chunks_sent = sum(m.chunks_sent for m in session_metrics.values())
-    total_chunks_dropped = sum(m.chunks_dropped for m in session_metrics.values())
-    
-    # Build per-session metrics
+
+    # Global totals come from the running aggregate (O(1)); only the
+    # per-session detail requires walking a snapshot of the sessions dict
+    total_bytes_sent = global_metrics["total_bytes_sent"]
     sessions_data = {}
-    for sid, metrics in session_metrics.items():
-        queue = audio_queues.get(sid)
+    for sid, state in list(sessions.items()):
+        metrics = state.metrics
+        queue = state.ring
         sessions_data[sid] = {
             "book_title": metrics.book_title,
-            "start_time": metrics.start_time.isoformat(),
+            # orjson serializes datetimes natively, no isoformat() needed
+            "start_time": metrics.start_time,
             "duration_seconds": round((now - metrics.start_time).total_seconds(), 1),
             "chunks_received": metrics.chunks_received,
             "bytes_received": metrics.bytes_received,
@@ -599,23 +886,36 @@ async def get_metrics():
                 (metrics.chunks_dropped / metrics.chunks_received * 100) 
                 if metrics.chunks_received > 0 else 0, 2
             ),
-            "queue_depth": queue.qsize() if queue else 0,
+            "queue_depth": len(queue) if queue else 0,
             "max_queue_depth": metrics.max_queue_depth,
             "connected_clients": metrics.connected_clients,
         }
     
-    return {
-        "timestamp": now.isoformat(),
+    payload = {
+        "timestamp": now,
         "uptime_seconds": round(uptime_seconds, 1),
-        "active_sessions": len(session_metrics),
+        "active_sessions": len(sessions),
         "total_bytes_sent": total_bytes_sent,
         "total_kb_sent": round(total_bytes_sent / 1024, 1),
-        "total_chunks_sent": total_chunks_sent,
-        "total_chunks_dropped": total_chunks_dropped,
+        "total_chunks_sent": global_metrics["total_chunks_sent"],
+        "total_chunks_dropped": global_metrics["total_chunks_dropped"],
         "sessions": sessions_data,
     }
+    _metrics_cache = (bucket, payload)
+    return payload
 
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvloop + httptools (bundled with uvicorn[standard]) are 2-4x faster
+    # than the stdlib loop for websocket-heavy workloads
+    workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+    if workers > 1:
+        # Sessions live in process memory, so multi-worker deployments need
+        # sticky routing on the session id (see backend/README.md)
+        uvicorn.run(
+            "main:app", host="0.0.0.0", port=8000,
+            loop="uvloop", http="httptools", ws="websockets", workers=workers,
+        )
+    else:
+        uvicorn.run(app, host="0.0.0.0", port=8000, loop="uvloop", http="httptools", ws="websockets")
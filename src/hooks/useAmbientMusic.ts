@@ -638,12 +638,19 @@ export function useAmbientMusic(): UseAmbientMusicResult {
     }
   }, [playNextInQueue]);
 
-  // Handle incoming audio chunk from Socket.IO
-  const handleAudioChunk = useCallback((data: { data: string }) => {
-    if (!data.data) return;
-    
-    // Buffer audio chunk
-    const audioData = base64ToUint8Array(data.data);
+  // Handle incoming audio chunk from Socket.IO.
+  // The backend sends raw PCM as a binary frame (ArrayBuffer on the client);
+  // the legacy base64 object form is still accepted for compatibility.
+  const handleAudioChunk = useCallback((data: ArrayBuffer | Uint8Array | { data: string }) => {
+    let audioData: Uint8Array;
+    if (data instanceof ArrayBuffer) {
+      audioData = new Uint8Array(data);
+    } else if (data instanceof Uint8Array) {
+      audioData = data;
+    } else {
+      if (!data.data) return;
+      audioData = base64ToUint8Array(data.data);
+    }
     const chunkSize = audioData.length;
     
     if (chunkSize > 0) {